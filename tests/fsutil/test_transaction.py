@@ -3,12 +3,14 @@
 # https://opensource.org/licenses/MIT.
 
 import unittest
+import unittest.mock
 from typing import Callable
 
 import pytest
 
 from zappend.fsutil.fileobj import FileObj
 from zappend.fsutil.transaction import Transaction
+from zappend.fsutil.transaction import ROLLBACK_BUFFER_SIZE
 from zappend.fsutil.transaction import ROLLBACK_FILE
 from ..helpers import clear_memory_fs
 
@@ -99,19 +101,8 @@ class TransactionTest(unittest.TestCase):
                 create_test_folder(rollback_cb)
 
                 if rollback:
-                    rollback_data = rollback_file.read(mode="rt")
-                    rollback_records = [
-                        line.split(";")[:2] for line in rollback_data.split("\n")
-                    ]
-                    self.assertEqual(
-                        [
-                            ["replace_file", "file-1.txt"],
-                            ["delete_file", "file-2.txt"],
-                            ["delete_dir", "folder"],
-                            [""],
-                        ],
-                        rollback_records,
-                    )
+                    # Rollback records are buffered
+                    self.assertEqual("", rollback_file.read(mode="rt"))
 
                 if fail:
                     raise OSError("disk full (this is a test!)")
@@ -142,6 +133,79 @@ class TransactionTest(unittest.TestCase):
             self.assertTrue(test_file_3.exists())
             self.assertEqual(b"4-5-6", test_file_3.read())
 
+    def test_it_writes_rollback_records_in_batches(self):
+        test_root = FileObj("memory://test")
+        test_root.mkdir()
+        test_files = [
+            test_root / f"file-{i}.txt" for i in range(ROLLBACK_BUFFER_SIZE + 1)
+        ]
+        test_files[0].write("A-B-C")
+
+        transaction = Transaction(test_root, FileObj("memory://temp"))
+        rollback_file = transaction.rollback_dir / ROLLBACK_FILE
+        try:
+            with transaction as rollback_cb:
+                original_data = test_files[0].read()
+                test_files[0].write("D-E-F")
+                rollback_cb("replace_file", test_files[0].filename, original_data)
+                for test_file in test_files[1:]:
+                    test_file.write("1-2-3")
+                    rollback_cb("delete_file", test_file.filename, None)
+                rollback_data = rollback_file.read(mode="rt")
+                self.assertEqual(
+                    ["replace_file;file-0.txt;backup-0"]
+                    + [
+                        f"delete_file;{test_file.filename}"
+                        for test_file in test_files[1:ROLLBACK_BUFFER_SIZE]
+                    ]
+                    + [""],
+                    rollback_data.split("\n"),
+                )
+                raise OSError("disk full (this is a test!)")
+        except OSError:
+            pass
+
+        self.assertEqual(b"A-B-C", test_files[0].read())
+        for test_file in test_files[1:]:
+            self.assertFalse(test_file.exists())
+
+    def test_it_rolls_back_if_rollback_records_cannot_be_written(self):
+        test_root = FileObj("memory://test")
+        test_root.mkdir()
+        test_files = [test_root / f"file-{i}.txt" for i in range(ROLLBACK_BUFFER_SIZE)]
+        test_files[0].write("A-B-C")
+
+        transaction = Transaction(test_root, FileObj("memory://temp"))
+        memory_fs = test_root.fs
+        _open = type(memory_fs)._open
+
+        # Appending to the rollback file fails when its data is stored
+        def failing_open(fs, path, mode="rb", **kwargs):
+            f = _open(fs, path, mode=mode, **kwargs)
+            if "a" in mode:
+
+                def close():
+                    raise OSError("cannot write (this is a test!)")
+
+                f.close = close
+            return f
+
+        with pytest.raises(OSError, match="cannot write"):
+            with unittest.mock.patch.object(type(memory_fs), "_open", new=failing_open):
+                with transaction as rollback_cb:
+                    original_data = test_files[0].read()
+                    test_files[0].write("D-E-F")
+                    rollback_cb("replace_file", test_files[0].filename, original_data)
+                    for test_file in test_files[1:]:
+                        test_file.write("1-2-3")
+                        rollback_cb("delete_file", test_file.filename, None)
+
+        self.assertEqual(b"A-B-C", test_files[0].read())
+        for test_file in test_files[1:]:
+            self.assertFalse(test_file.exists())
+        self.assertFalse(transaction.rollback_dir.exists())
+        self.assertFalse(transaction.lock_file.exists())
+
     # noinspection PyMethodMayBeStatic
     def test_it_raises_on_nested_transaction(self):
         test_root = FileObj("memory://test")
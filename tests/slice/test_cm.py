@@ -5,6 +5,7 @@
 import contextlib
 import shutil
 import unittest
+import unittest.mock
 import warnings
 
 try:
@@ -12,14 +13,17 @@ try:
     import h5netcdf
 except ModuleNotFoundError:
     h5netcdf = None
+import numcodecs
 import pytest
 import xarray as xr
+import zarr
 
 from zappend.context import Context
 from zappend.fsutil.fileobj import FileObj
 from zappend.slice.cm import SliceSourceContextManager
 from zappend.slice.cm import open_slice_dataset
 from zappend.slice.source import SliceSource
+from zappend.slice.sources import persistent
 from zappend.slice.sources.memory import MemorySliceSource
 from zappend.slice.sources.persistent import PersistentSliceSource
 from zappend.slice.sources.temporary import TemporarySliceSource
@@ -58,6 +62,27 @@ class OpenSliceDatasetTest(unittest.TestCase):
         with slice_cm as slice_ds:
             self.assertIsInstance(slice_ds, xr.Dataset)
 
+    def test_slice_item_is_persisted_dataset_uncompressed(self):
+        dataset = make_test_dataset()
+        dataset.chl.encoding["compressor"] = numcodecs.Zstd()
+        temp_dir = FileObj("memory://temp")
+        temp_dir.mkdir()
+        ctx = Context(
+            dict(
+                target_dir="memory://target.zarr",
+                temp_dir=temp_dir.uri,
+                persist_mem_slices=True,
+            )
+        )
+        slice_cm = open_slice_dataset(ctx, dataset)
+        with slice_cm as slice_ds:
+            (temp_slice_path,) = temp_dir.fs.ls(temp_dir.path, detail=False)
+            temp_group = zarr.open_group(temp_dir.fs.get_mapper(temp_slice_path))
+            self.assertIsNone(temp_group["chl"].compressor)
+            self.assertIsNone(temp_group["tsm"].compressor)
+            self.assertEqual(numcodecs.Zstd(), slice_ds.chl.encoding["compressor"])
+            self.assertNotIn("compressor", slice_ds.tsm.encoding)
+
     def test_slice_item_is_file_obj(self):
         slice_dir = FileObj("memory://slice.zarr")
         make_test_dataset(uri=slice_dir.uri)
@@ -117,6 +142,46 @@ class OpenSliceDatasetTest(unittest.TestCase):
             shutil.rmtree(target_dir.path, ignore_errors=True)
             slice_file.delete()
 
+    def test_slice_item_is_uri_of_remote_fs_nc_keeps_file_open(self):
+        ctx = Context(dict(target_dir="memory://target.zarr", slice_engine="h5netcdf"))
+        slice_file = FileObj("memory://slice.nc")
+        slice_fo = unittest.mock.MagicMock()
+        slice_source = PersistentSliceSource(ctx, slice_file)
+        with unittest.mock.patch.object(
+            slice_file.fs, "open", return_value=slice_fo
+        ) as open_mock:
+            with unittest.mock.patch.object(
+                xr, "open_dataset", return_value=xr.Dataset()
+            ) as open_dataset_mock:
+                slice_ds = slice_source.get_dataset()
+        self.assertIsInstance(slice_ds, xr.Dataset)
+        open_mock.assert_called_once_with(
+            slice_file.path,
+            "rb",
+            block_size=4 * 1024 * 1024,
+            cache_type="blockcache",
+            cache_options={"maxblocks": 16},
+        )
+        open_dataset_mock.assert_called_once_with(slice_fo, engine="h5netcdf")
+        slice_fo.close.assert_not_called()
+        slice_source.close()
+        slice_fo.close.assert_called_once_with()
+
+    def test_slice_item_is_uri_of_remote_fs_nc_closes_file_on_error(self):
+        ctx = Context(dict(target_dir="memory://target.zarr", slice_engine="h5netcdf"))
+        slice_file = FileObj("memory://slice.nc")
+        slice_fo = unittest.mock.MagicMock()
+        slice_source = PersistentSliceSource(ctx, slice_file)
+        with unittest.mock.patch.object(slice_file.fs, "open", return_value=slice_fo):
+            with unittest.mock.patch.object(
+                xr, "open_dataset", side_effect=ValueError("not a NetCDF file")
+            ):
+                with pytest.raises(ValueError, match="not a NetCDF file"):
+                    slice_source.get_dataset()
+        slice_fo.close.assert_called_once_with()
+        slice_source.close()
+        slice_fo.close.assert_called_once_with()
+
     def test_slice_item_is_uri_with_polling_ok(self):
         slice_dir = FileObj("memory://slice.zarr")
         make_test_dataset(uri=slice_dir.uri)
@@ -145,6 +210,71 @@ class OpenSliceDatasetTest(unittest.TestCase):
             with slice_cm:
                 pass
 
+    def test_slice_item_is_uri_with_polling_backoff(self):
+        slice_dir = FileObj("memory://slice.zarr")
+        ctx = Context(
+            dict(
+                target_dir="memory://target.zarr",
+                slice_polling=dict(timeout=1.0, interval=0.02),
+            )
+        )
+        slice_cm = open_slice_dataset(ctx, slice_dir.uri)
+        # Use a fake clock, so delays do not depend on the wall clock
+        clock = [0.0]
+        intervals = []
+
+        def monotonic():
+            return clock[0]
+
+        def sleep(interval):
+            intervals.append(interval)
+            clock[0] += interval
+
+        fake_time = unittest.mock.Mock(monotonic=monotonic, sleep=sleep)
+        with unittest.mock.patch.object(persistent, "time", new=fake_time):
+            with pytest.raises(FileNotFoundError, match=slice_dir.uri):
+                with slice_cm:
+                    pass
+        self.assertEqual([0.02, 0.04, 0.08, 0.16], intervals[:4])
+        self.assertTrue(all(0 < i <= 0.16 for i in intervals[4:]))
+        self.assertAlmostEqual(1.0, sum(intervals))
+
+    def test_slice_item_is_uri_with_polling_checks_existence(self):
+        slice_dir = FileObj("memory://slice.zarr")
+        ctx = Context(
+            dict(
+                target_dir="memory://target.zarr",
+                slice_polling=dict(timeout=0.1, interval=0.02),
+            )
+        )
+        slice_cm = open_slice_dataset(ctx, slice_dir.uri)
+        with unittest.mock.patch.object(
+            PersistentSliceSource,
+            "_open_slice_dataset",
+            side_effect=FileNotFoundError(slice_dir.uri),
+        ) as open_mock:
+            with pytest.raises(FileNotFoundError, match=slice_dir.uri):
+                with slice_cm:
+                    pass
+        # Only the final attempt at the deadline
+        open_mock.assert_called_once_with()
+
+    def test_slice_item_is_uri_with_polling_and_unreliable_existence(self):
+        slice_dir = FileObj("memory://slice.zarr")
+        make_test_dataset(uri=slice_dir.uri)
+        ctx = Context(
+            dict(
+                target_dir="memory://target.zarr",
+                slice_polling=dict(timeout=0.1, interval=0.02),
+            )
+        )
+        slice_cm = open_slice_dataset(ctx, slice_dir.uri)
+        with unittest.mock.patch.object(
+            PersistentSliceSource, "_slice_exists", return_value=False
+        ):
+            with slice_cm as slice_ds:
+                self.assertIsInstance(slice_ds, xr.Dataset)
+
     def test_slice_item_is_context_manager(self):
         @contextlib.contextmanager
         def get_dataset(name):
@@ -222,6 +352,26 @@ class OpenSliceDatasetTest(unittest.TestCase):
             with slice_cm as slice_ds:
                 self.assertIsInstance(slice_ds, xr.Dataset)
 
+    def test_slice_item_is_slice_source_arg_without_close(self):
+        class MySliceSource(SliceSource):
+            def __init__(self, name):
+                self.name = name
+
+            def get_dataset(self):
+                return xr.Dataset()
+
+        ctx = Context(
+            dict(
+                target_dir="memory://target.zarr",
+                slice_source=MySliceSource,
+            )
+        )
+        slice_cm = open_slice_dataset(ctx, "bibo")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", category=DeprecationWarning)
+            with slice_cm as slice_ds:
+                self.assertIsInstance(slice_ds, xr.Dataset)
+
     def test_slice_item_is_slice_source_arg_with_extra_kwargs(self):
         class MySliceSource(SliceSource):
             def __init__(self, *args, **kwargs):
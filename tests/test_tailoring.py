@@ -23,6 +23,35 @@ def make_context(config: dict, target_ds: xr.Dataset, write: bool = False) -> Co
     return ctx
 
 
+def make_slice_ds() -> xr.Dataset:
+    slice_ds = xr.Dataset(
+        {
+            "a": xr.DataArray(
+                np.zeros((2, 3, 4)),
+                dims=("time", "y", "x"),
+                attrs={"units": "mg/m^3"},
+            ).chunk({"time": 1}),
+            "b": xr.DataArray(
+                np.zeros((2, 3, 4)),
+                dims=("time", "y", "x"),
+                attrs={"units": "g/m^3"},
+            ).chunk({"time": 1}),
+        }
+    )
+    slice_ds.a.encoding = {"dtype": "float32"}
+    slice_ds.b.encoding = {"dtype": "float32"}
+    return slice_ds
+
+
+# Variable "a" is chunked as configured, "b" has no configured chunks
+slice_chunks_config = {
+    "variables": {
+        "a": {"encoding": {"dtype": "float32", "chunks": [1, 3, 4]}},
+        "b": {"encoding": {"dtype": "float32"}},
+    }
+}
+
+
 class TailorTargetDatasetTest(unittest.TestCase):
     def setUp(self):
         clear_memory_fs()
@@ -68,6 +97,15 @@ class TailorTargetDatasetTest(unittest.TestCase):
         self.assertEqual(0.03, b.encoding.get("scale_factor"))
         self.assertEqual({"units": "g/m^3"}, b.attrs)
 
+    def test_it_does_not_modify_slice(self):
+        slice_ds = make_slice_ds()
+        ctx = make_context(slice_chunks_config, slice_ds)
+        tailor_target_dataset(ctx, slice_ds)
+        self.assertEqual({"units": "mg/m^3"}, slice_ds.a.attrs)
+        self.assertEqual({"dtype": "float32"}, slice_ds.a.encoding)
+        self.assertEqual({"units": "g/m^3"}, slice_ds.b.attrs)
+        self.assertEqual({"dtype": "float32"}, slice_ds.b.encoding)
+
     def test_it_strips_vars(self):
         slice_ds = xr.Dataset(
             {
@@ -102,21 +140,51 @@ class TailorTargetDatasetTest(unittest.TestCase):
                         "dims": ["time", "y", "x"],
                         "encoding": {"dtype": "uint32"},
                     },
+                    "d": {
+                        "dims": ["time", "y", "x"],
+                        "encoding": {"dtype": "float32", "fill_value": -999.0},
+                    },
+                    "e": {
+                        "dims": ["time", "y", "x"],
+                        "encoding": {
+                            "dtype": "int16",
+                            "fill_value": -1,
+                            "scale_factor": 0.1,
+                        },
+                    },
                 },
             },
             slice_ds,
         )
 
-        tailored_ds = tailor_target_dataset(ctx, slice_ds)
-        self.assertEqual({"a", "b", "c"}, set(tailored_ds.variables.keys()))
+        with self.assertLogs("zappend", level="WARNING") as cm:
+            tailored_ds = tailor_target_dataset(ctx, slice_ds)
+        self.assertEqual(1, len(cm.output))
+        self.assertIn("Variables not found in slice dataset", cm.output[0])
+        self.assertIn("'b'", cm.output[0])
+        self.assertIn("'c'", cm.output[0])
+        self.assertIn("'e'", cm.output[0])
+        self.assertEqual({"a", "b", "c", "d", "e"}, set(tailored_ds.variables.keys()))
 
         b = tailored_ds.b
-        self.assertEqual(np.dtype("float64"), b.dtype)
+        self.assertEqual(np.dtype("int16"), b.dtype)
         self.assertEqual(np.dtype("int16"), b.encoding.get("dtype"))
+        self.assertTrue(np.all(b.values == 0))
 
         c = tailored_ds.c
         self.assertEqual(np.dtype("uint32"), c.dtype)
         self.assertEqual(np.dtype("uint32"), c.encoding.get("dtype"))
+        self.assertTrue(np.all(c.values == 0))
+
+        d = tailored_ds.d
+        self.assertEqual(np.dtype("float32"), d.dtype)
+        self.assertEqual(np.dtype("float32"), d.encoding.get("dtype"))
+        self.assertTrue(np.all(np.isnan(d.values)))
+
+        e = tailored_ds.e
+        self.assertEqual(np.dtype("float64"), e.dtype)
+        self.assertEqual(np.dtype("int16"), e.encoding.get("dtype"))
+        self.assertTrue(np.all(np.isnan(e.values)))
 
     def test_it_updates_attrs_according_to_update_mode(self):
         target_ds = xr.Dataset(
@@ -204,6 +272,15 @@ class TailorSliceDatasetTest(unittest.TestCase):
         self.assertIsInstance(tailored_ds, xr.Dataset)
         self.assertEqual({"a", "b"}, set(tailored_ds.variables.keys()))
 
+    def test_it_does_not_modify_slice(self):
+        slice_ds = make_slice_ds()
+        ctx = make_context(slice_chunks_config, slice_ds)
+        tailor_slice_dataset(ctx, slice_ds)
+        self.assertEqual({"units": "mg/m^3"}, slice_ds.a.attrs)
+        self.assertEqual({"dtype": "float32"}, slice_ds.a.encoding)
+        self.assertEqual({"units": "g/m^3"}, slice_ds.b.attrs)
+        self.assertEqual({"dtype": "float32"}, slice_ds.b.encoding)
+
     def test_it_clears_var_encoding_and_attrs(self):
         slice_ds = xr.Dataset(
             {
@@ -30,7 +30,11 @@ SLICE_POLLING_SCHEMA = {
             "type": "object",
             "properties": dict(
                 interval={
-                    "description": "Polling interval in seconds.",
+                    "description": (
+                        "Initial polling interval in seconds."
+                        " The interval is doubled after each failed attempt,"
+                        " up to eight times the given interval."
+                    ),
                     "type": "number",
                     "exclusiveMinimum": 0,
                     "default": DEFAULT_SLICE_POLLING_INTERVAL,
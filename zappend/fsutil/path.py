@@ -6,10 +6,9 @@
 def split_parent(path: str, sep: str = "/") -> tuple[str, str]:
     if not path:
         raise ValueError("cannot get parent of empty path")
-    comps = path.rsplit(sep, maxsplit=1)
-    if len(comps) == 1:
-        return "", comps[0]
-    parent, rest = comps
+    parent, found_sep, rest = path.rpartition(sep)
+    if not found_sep:
+        return "", rest
     return parent or "/", rest
 
 
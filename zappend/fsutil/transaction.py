@@ -2,6 +2,8 @@
 # Permissions are hereby granted under the terms of the MIT License:
 # https://opensource.org/licenses/MIT.
 
+import itertools
+import threading
 import uuid
 from typing import Callable, Literal
 
@@ -27,6 +29,9 @@ ROLLBACK_CSV_SEP = ";"
 
 ROLLBACK_ACTIONS = "delete_dir", "delete_file", "replace_file"
 
+# Number of rollback records collected before they are written
+ROLLBACK_BUFFER_SIZE = 64
+
 
 class Transaction:
     """A filesystem transaction.
@@ -91,6 +96,11 @@ class Transaction:
         self._target_dir = target_dir
         self._lock_file = self.get_lock_file(target_dir)
         self._disable_rollback = disable_rollback
+        self._rollback_entries: list[str] = []
+        self._rollback_lock = threading.Lock()
+        # The rollback directory is unique, so a counter suffices
+        # to create unique names for backup files within it
+        self._backup_ids = itertools.count()
         self._entered_ctx = False
 
     @classmethod
@@ -139,16 +149,20 @@ class Transaction:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._assert_entered_ctx()
 
-        if exc_type is not None and self._rollback_file.exists():
+        # Note, we know the rollback file exists if rollback is enabled,
+        # because we created it ourselves, so no need to check.
+        if exc_type is not None and not self._disable_rollback:
             logger.error("Error in transaction", exc_info=True)
 
-            rollback_txt = self._rollback_file.read(mode="r")
+            try:
+                rollback_lines = self._rollback_file.read(mode="r").splitlines()
+            except OSError:
+                logger.warning("Failed to read rollback records", exc_info=True)
+                rollback_lines = []
+            # Add the records that have not been written yet
+            rollback_lines.extend(self._rollback_entries)
             rollback_records = [
-                record
-                for record in [
-                    line.split(ROLLBACK_CSV_SEP) for line in rollback_txt.split("\n")
-                ]
-                if record and record != [""]
+                line.split(ROLLBACK_CSV_SEP) for line in rollback_lines if line
             ]
 
             if rollback_records:
@@ -217,7 +231,7 @@ class Transaction:
         assert hasattr(self, "_" + action)
 
         if data is not None:
-            backup_id = str(uuid.uuid4())
+            backup_id = f"backup-{next(self._backup_ids)}"
             backup_file = self._rollback_dir.for_path(backup_id)
             backup_file.write(data)
             rollback_entry = ROLLBACK_CSV_SEP.join((action, path, backup_id))
@@ -225,7 +239,21 @@ class Transaction:
             rollback_entry = ROLLBACK_CSV_SEP.join((action, path))
 
         logger.debug(f"Recording rollback record: {rollback_entry!r}")
-        self._rollback_file.write(rollback_entry + "\n", mode="a")
+        # Records are written in batches rather than one by one, since
+        # appending to a file may be expensive, e.g., for object stores.
+        # Records not yet written are rolled back from memory.
+        # Note, this callback may be called from multiple threads.
+        with self._rollback_lock:
+            self._rollback_entries.append(rollback_entry)
+            if len(self._rollback_entries) >= ROLLBACK_BUFFER_SIZE:
+                self._flush_rollback_entries()
+
+    def _flush_rollback_entries(self):
+        if self._rollback_entries:
+            rollback_txt = "".join(e + "\n" for e in self._rollback_entries)
+            self._rollback_file.write(rollback_txt, mode="a")
+            # Clear the records only after they have been written
+            self._rollback_entries = []
 
     def _assert_entered_ctx(self):
         if not self._entered_ctx:
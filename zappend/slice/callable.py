@@ -2,11 +2,17 @@
 # Permissions are hereby granted under the terms of the MIT License:
 # https://opensource.org/licenses/MIT.
 
+import functools
 import importlib
+import importlib.util
 import inspect
+import sys
 from typing import Any, Type
 
+import xarray as xr
+
 from ..context import Context
+from ..fsutil import FileObj
 from .source import SliceCallable
 from .source import SliceItem
 
@@ -40,15 +46,19 @@ def invoke_slice_callable(
     if ctx_parameter is not None:
         if ctx_parameter.default is ctx_parameter.empty:
             # parameter "ctx" given as 1st positional argument
-            slice_args = (ctx,) + tuple(slice_args)
+            return slice_callable(ctx, *slice_args, **slice_kwargs)
         else:
             # parameter "ctx" given as keyword argument
-            slice_kwargs = dict(**slice_kwargs, ctx=ctx)
+            return slice_callable(*slice_args, ctx=ctx, **slice_kwargs)
 
     return slice_callable(*slice_args, **slice_kwargs)
 
 
 def to_slice_args(arg: Any) -> tuple[tuple[...], dict[str, Any]]:
+    arg_type = type(arg)
+    if arg_type is str or arg_type is FileObj or arg_type is xr.Dataset:
+        # Fast path for the most common case, a single positional argument
+        return (arg,), {}
     if isinstance(arg, tuple):
         try:
             args, kwargs = arg
@@ -95,6 +105,7 @@ def to_slice_callable(slice_source_type: str | Type) -> SliceCallable | None:
     return slice_source_type
 
 
+@functools.lru_cache(maxsize=128)
 def import_attribute(name: str) -> Any:
     parts = [part for part in name.split(".") if part]
 
@@ -102,26 +113,26 @@ def import_attribute(name: str) -> Any:
 
     n = len(parts)
     i0 = -1
-    for i in range(n):
-        module_name = ".".join(parts[: n - i])
-        try:
-            module = importlib.import_module(module_name)
-            i0 = n - i
-            break
-        except ModuleNotFoundError:
-            pass
+    for i in range(1, n + 1):
+        module_name = ".".join(parts[:i])
+        if module_name not in sys.modules:
+            if module is not None and not hasattr(module, "__path__"):
+                # Only packages can have submodules
+                break
+            # Unlike importing, find_spec() does not raise if the module
+            # does not exist, given that its parent package exists
+            if importlib.util.find_spec(module_name) is None:
+                break
+        module = importlib.import_module(module_name)
+        i0 = i
 
     if module is None or i0 == n:
         raise ImportError(f"no attribute found named {name!r}")
 
-    obj = module
-    for attr_name in parts[i0:]:
-        try:
-            obj = getattr(obj, attr_name)
-        except AttributeError:
-            raise ImportError(
-                f"attribute {'.'.join(parts[i0:])!r} not found"
-                f" in module {'.'.join(parts[:i0])!r}"
-            )
-
-    return obj
+    try:
+        return functools.reduce(getattr, parts[i0:], module)
+    except AttributeError:
+        raise ImportError(
+            f"attribute {'.'.join(parts[i0:])!r} not found"
+            f" in module {'.'.join(parts[:i0])!r}"
+        )
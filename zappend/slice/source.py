@@ -27,6 +27,18 @@ class SliceSource(ABC):
     argument or as keyword argument.
     """
 
+    __slots__ = ()
+
+    # Whether a subclass overrides the deprecated dispose() method
+    _overrides_dispose = False
+    # Whether the deprecation warning for dispose() has been emitted
+    _dispose_warned = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._overrides_dispose = cls.dispose is not SliceSource.dispose
+        cls._dispose_warned = False
+
     @abstractmethod
     def get_dataset(self) -> xr.Dataset:
         """Open this slice source, do some processing and return a dataset of type
@@ -53,13 +65,16 @@ class SliceSource(ABC):
         This method is not intended to be called directly
         and is called exactly once for each instance of this class.
         """
-        if hasattr(self, "dispose"):
-            warnings.warn(
-                "The dispose() method of SliceSource has been"
-                " deprecated since zappend 0.6.0,"
-                " please override close() instead.",
-                category=DeprecationWarning,
-            )
+        cls = type(self)
+        if cls._overrides_dispose:
+            if not cls._dispose_warned:
+                cls._dispose_warned = True
+                warnings.warn(
+                    "The dispose() method of SliceSource has been"
+                    " deprecated since zappend 0.6.0,"
+                    " please override close() instead.",
+                    category=DeprecationWarning,
+                )
             self.dispose()
 
     def dispose(self):
@@ -86,29 +101,26 @@ def to_slice_source(
     slice_index: int,
 ) -> SliceSource | ContextManager[xr.Dataset]:
     # prevent cyclic import
-    from .sources import MemorySliceSource
-    from .sources import PersistentSliceSource
-    from .sources import TemporarySliceSource
     from .callable import invoke_slice_callable
 
     slice_callable = ctx.config.slice_source
     if slice_callable is not None:
         slice_item = invoke_slice_callable(slice_callable, slice_item, ctx)
 
+    # Dispatch on the exact type first, which covers the common cases
+    # without walking the MRO of the ABCs checked below.
+    to_source = _SLICE_SOURCE_FACTORIES.get(type(slice_item))
+    if to_source is not None:
+        return to_source(ctx, slice_item, slice_index)
+
     if isinstance(slice_item, SliceSource):
         return slice_item
     if isinstance(slice_item, str):
-        slice_file = FileObj(
-            slice_item, storage_options=ctx.config.slice_storage_options
-        )
-        return PersistentSliceSource(ctx, slice_file)
+        return _str_to_slice_source(ctx, slice_item, slice_index)
     if isinstance(slice_item, FileObj):
-        return PersistentSliceSource(ctx, slice_item)
+        return _file_obj_to_slice_source(ctx, slice_item, slice_index)
     if isinstance(slice_item, xr.Dataset):
-        if ctx.config.persist_mem_slices:
-            return TemporarySliceSource(ctx, slice_item, slice_index)
-        else:
-            return MemorySliceSource(slice_item, slice_index)
+        return _dataset_to_slice_source(ctx, slice_item, slice_index)
     if isinstance(slice_item, contextlib.AbstractContextManager):
         return slice_item
     raise TypeError(
@@ -120,3 +132,38 @@ def to_slice_source(
         f" zappend.api.SliceSource,"
         f" but was type {type(slice_item).__name__}"
     )
+
+
+# noinspection PyUnusedLocal
+def _str_to_slice_source(ctx: Context, slice_item: str, slice_index: int):
+    # prevent cyclic import
+    from .sources import PersistentSliceSource
+
+    slice_file = FileObj(slice_item, storage_options=ctx.config.slice_storage_options)
+    return PersistentSliceSource(ctx, slice_file)
+
+
+# noinspection PyUnusedLocal
+def _file_obj_to_slice_source(ctx: Context, slice_item: FileObj, slice_index: int):
+    # prevent cyclic import
+    from .sources import PersistentSliceSource
+
+    return PersistentSliceSource(ctx, slice_item)
+
+
+def _dataset_to_slice_source(ctx: Context, slice_item: xr.Dataset, slice_index: int):
+    # prevent cyclic import
+    from .sources import MemorySliceSource
+    from .sources import TemporarySliceSource
+
+    if ctx.config.persist_mem_slices:
+        return TemporarySliceSource(ctx, slice_item, slice_index)
+    else:
+        return MemorySliceSource(slice_item, slice_index)
+
+
+_SLICE_SOURCE_FACTORIES = {
+    str: _str_to_slice_source,
+    FileObj: _file_obj_to_slice_source,
+    xr.Dataset: _dataset_to_slice_source,
+}
@@ -16,6 +16,8 @@ class MemorySliceSource(SliceSource):
         slice_index: An index for slice identification (logging only)
     """
 
+    __slots__ = ("_slice_ds", "_slice_index")
+
     def __init__(self, slice_ds: xr.Dataset, slice_index: int):
         self._slice_ds = slice_ds
         self._slice_index = slice_index
@@ -12,6 +12,16 @@ from zappend.fsutil.fileobj import FileObj
 from zappend.log import logger
 from ..source import SliceSource
 
+_ZARR_SUFFIXES = (".zarr", ".zarr.zip")
+
+# Block size and number of blocks of the cache used to read
+# non-Zarr slices from remote filesystems, i.e., at most 64 MiB per slice
+_BLOCK_SIZE = 4 * 1024 * 1024
+_MAX_BLOCKS = 16
+
+# Maximum polling interval as a multiple of the configured interval
+_MAX_POLLING_INTERVAL_FACTOR = 8
+
 
 class PersistentSliceSource(SliceSource):
     """
@@ -22,9 +32,28 @@ class PersistentSliceSource(SliceSource):
         slice_file: Slice file object
     """
 
+    __slots__ = (
+        "_config",
+        "_slice_file",
+        "_engine",
+        "_storage_options",
+        "_is_local",
+        "_slice_fo",
+        "_slice_ds",
+    )
+
     def __init__(self, ctx: Context, slice_file: FileObj):
+        engine = ctx.config.slice_engine
+        if engine is None and slice_file.path.endswith(_ZARR_SUFFIXES):
+            engine = "zarr"
         self._config = ctx.config
         self._slice_file = slice_file
+        self._engine = engine
+        self._storage_options = ctx.config.slice_storage_options
+        self._is_local = isinstance(
+            slice_file.fs, fsspec.implementations.local.LocalFileSystem
+        )
+        self._slice_fo = None
         self._slice_ds: xr.Dataset | None = None
 
     def get_dataset(self) -> xr.Dataset:
@@ -36,6 +65,9 @@ class PersistentSliceSource(SliceSource):
         if self._slice_ds is not None:
             self._slice_ds.close()
             self._slice_ds = None
+        if self._slice_fo is not None:
+            self._slice_fo.close()
+            self._slice_fo = None
         logger.info(f"Slice dataset {self._slice_file.uri} closed")
 
     def _wait_for_slice_dataset(self) -> xr.Dataset:
@@ -43,35 +75,70 @@ class PersistentSliceSource(SliceSource):
         if timeout is None:
             return self._open_slice_dataset()
 
-        # t0 = time.monotonic()
-        # while (time.monotonic() - t0) < timeout:
-        t0 = time.monotonic()
+        # Retry with exponential backoff, starting with the configured
+        # interval and capped by a fixed multiple of it, so we hit the
+        # filesystem less often if a slice is slow to arrive, but do not
+        # wait much longer than needed once it has arrived.
+        # The last delay is clipped so that we make a final attempt
+        # right at the deadline instead of sleeping beyond it.
+        max_interval = _MAX_POLLING_INTERVAL_FACTOR * interval
+        deadline = time.monotonic() + timeout
         while True:
-            delta = time.monotonic() - t0
-            if delta >= timeout:
-                raise FileNotFoundError(self._slice_file.uri)
-            try:
-                return self._open_slice_dataset()
-            except OSError:
+            # A cheap existence check avoids a full open attempt, which for
+            # Zarr slices means reading many metadata objects, while the
+            # slice has not yet arrived. Some filesystems, e.g., for HTTP
+            # URLs, may report existing slices as missing though, so we
+            # try to open the slice anyway once the time is up.
+            last_attempt = time.monotonic() >= deadline
+            if last_attempt or self._slice_exists():
+                try:
+                    return self._open_slice_dataset()
+                except OSError as e:
+                    if last_attempt:
+                        raise FileNotFoundError(self._slice_file.uri) from e
+            delay = min(interval, deadline - time.monotonic())
+            if delay > 0:
                 logger.debug(
-                    f"Slice not ready or corrupt, retrying after {interval} seconds"
+                    f"Slice not ready or corrupt, retrying after {delay} seconds"
                 )
-                time.sleep(interval)
+                time.sleep(delay)
+            interval = min(2 * interval, max_interval)
+
+    def _slice_exists(self) -> bool:
+        if not self._is_local:
+            # Remote filesystems may cache listings, make sure
+            # we do not miss a slice that has arrived meanwhile.
+            self._slice_file.fs.invalidate_cache(self._slice_file.path)
+        try:
+            return self._slice_file.exists()
+        except OSError:
+            return False
 
     def _open_slice_dataset(self) -> xr.Dataset:
-        engine = self._config.slice_engine
-        if engine is None and (
-            self._slice_file.path.endswith(".zarr")
-            or self._slice_file.path.endswith(".zarr.zip")
-        ):
-            engine = "zarr"
+        engine = self._engine
         if engine == "zarr":
-            storage_options = self._config.slice_storage_options
-            return xr.open_zarr(self._slice_file.uri, storage_options=storage_options)
+            return xr.open_zarr(
+                self._slice_file.uri, storage_options=self._storage_options
+            )
 
-        fs = self._slice_file.fs
-        if isinstance(fs, fsspec.implementations.local.LocalFileSystem):
+        if self._is_local:
             return xr.open_dataset(self._slice_file.path, engine=engine)
 
-        fo = fs.open(self._slice_file.path, "rb")
-        return xr.open_dataset(fo, engine=engine)
+        # Readers such as h5netcdf issue many small random reads,
+        # the block cache serves most of them from memory rather than
+        # issuing a request to the filesystem for each of them.
+        fo = self._slice_file.fs.open(
+            self._slice_file.path,
+            "rb",
+            block_size=_BLOCK_SIZE,
+            cache_type="blockcache",
+            cache_options={"maxblocks": _MAX_BLOCKS},
+        )
+        try:
+            slice_ds = xr.open_dataset(fo, engine=engine)
+        except BaseException:
+            fo.close()
+            raise
+        # The dataset is lazy, so keep the file open until we are closed
+        self._slice_fo = fo
+        return slice_ds
@@ -2,6 +2,10 @@
 # Permissions are hereby granted under the terms of the MIT License:
 # https://opensource.org/licenses/MIT.
 
+import itertools
+import os
+import uuid
+
 import xarray as xr
 
 from zappend.context import Context
@@ -9,6 +13,12 @@ from zappend.fsutil.fileobj import FileObj
 from zappend.log import logger
 from .memory import MemorySliceSource
 
+# Random prefix and counter used to make names of temporary slice
+# directories unique. The prefix distinguishes processes that share the
+# same temp_dir, including processes on other hosts.
+_TEMP_SLICE_PREFIX = f"slice-{uuid.uuid4().hex[:8]}"
+_TEMP_SLICE_COUNTER = itertools.count()
+
 
 class TemporarySliceSource(MemorySliceSource):
     """A slice source that persists the in-memory dataset and returns
@@ -20,6 +30,8 @@ class TemporarySliceSource(MemorySliceSource):
         slice_index: An index for slice identification
     """
 
+    __slots__ = ("_config", "_temp_slice_dir", "_temp_slice_ds")
+
     def __init__(self, ctx: Context, slice_ds: xr.Dataset, slice_index: int):
         super().__init__(slice_ds, slice_index)
         self._config = ctx.config
@@ -28,7 +40,12 @@ class TemporarySliceSource(MemorySliceSource):
 
     def get_dataset(self) -> xr.Dataset:
         slice_index = self._slice_index
-        temp_slice_dir = self._config.temp_dir / f"slice-{slice_index}.zarr"
+        # The process ID is added for forked processes,
+        # which inherit the prefix and the counter
+        temp_slice_name = (
+            f"{_TEMP_SLICE_PREFIX}-{os.getpid()}-{next(_TEMP_SLICE_COUNTER)}.zarr"
+        )
+        temp_slice_dir = self._config.temp_dir / temp_slice_name
         self._temp_slice_dir = temp_slice_dir
         temp_slice_store = temp_slice_dir.fs.get_mapper(
             temp_slice_dir.path, create=True
@@ -37,10 +54,25 @@ class TemporarySliceSource(MemorySliceSource):
             f"Persisting in-memory slice dataset #{slice_index}"
             f" to {temp_slice_dir.uri}"
         )
-        self._slice_ds.to_zarr(temp_slice_store)
+        slice_ds = self._slice_ds.copy()
+        encodings = {k: v.encoding for k, v in self._slice_ds.variables.items()}
+        # The temporary slice is read back exactly once,
+        # so don't spend time on compressing it
+        for variable in slice_ds.variables.values():
+            variable.encoding = dict(variable.encoding, compressor=None)
+        slice_ds.to_zarr(temp_slice_store, write_empty_chunks=False, consolidated=True)
         self._slice_ds = None
-        self._temp_slice_ds = xr.open_zarr(temp_slice_store)
-        return self._temp_slice_ds
+        temp_slice_ds = xr.open_zarr(temp_slice_store, consolidated=True)
+        # Restore the original compressors, because the slice's encoding
+        # may be used to define the target dataset's encoding
+        for var_name, variable in temp_slice_ds.variables.items():
+            encoding = encodings.get(var_name, {})
+            if "compressor" in encoding:
+                variable.encoding["compressor"] = encoding["compressor"]
+            else:
+                variable.encoding.pop("compressor", None)
+        self._temp_slice_ds = temp_slice_ds
+        return temp_slice_ds
 
     def close(self):
         if self._temp_slice_ds is not None:
@@ -9,6 +9,7 @@ import xarray as xr
 from .context import Context
 from .log import logger
 from .metadata import DatasetMetadata
+from .metadata import Undefined
 
 
 def tailor_target_dataset(ctx: Context, slice_ds: xr.Dataset) -> xr.Dataset:
@@ -77,62 +78,100 @@ def tailor_slice_dataset(ctx: Context, slice_ds: xr.Dataset) -> xr.Dataset:
     # Remove any encoding and attributes from slice,
     # since both are prescribed by target
     for variable in slice_ds.variables.values():
-        variable.encoding = {}
-        variable.attrs = {}
+        if variable.encoding:
+            variable.encoding = {}
+        if variable.attrs:
+            variable.attrs = {}
     return slice_ds
 
 
 def _strip_dataset(dataset: xr.Dataset, target_metadata: DatasetMetadata) -> xr.Dataset:
     """Remove unwanted variables from `dataset` and return a copy."""
-    drop_var_names = set(map(str, dataset.variables.keys())) - set(
-        target_metadata.variables.keys()
-    )
+    target_var_names = target_metadata.variables.keys()
+    drop_var_names = [k for k in dataset.variables.keys() if k not in target_var_names]
+    # Note, we call drop_vars() even if there is nothing to drop,
+    # because we need a shallow copy that we can modify in place.
     return dataset.drop_vars(drop_var_names)
 
 
 def _complete_dataset(
     dataset: xr.Dataset, target_metadata: DatasetMetadata
 ) -> xr.Dataset:
-    undefined = object()
-    """Chunk existing variables according to chunks in encoding or 
+    """Chunk existing variables according to chunks in encoding or
     add missing variables to `dataset` (in-place operation) and return it.
     """
+    # Collect the new and updated variables, so that we can update the
+    # dataset once, because every update merges the entire dataset.
+    # Note, all variables are replaced, because the dataset shares its
+    # variables with the caller's dataset and their encoding and
+    # attributes are modified later.
+    new_vars = {}
+    missing_var_names = []
     for var_name, var_metadata in target_metadata.variables.items():
         var = dataset.variables.get(var_name)
-        encoding = var_metadata.encoding.to_dict()
-        chunks = encoding.get("chunks", undefined)
+        # Note, we read the encoding's attributes directly rather
+        # than creating a dictionary from it for every variable.
+        encoding = var_metadata.encoding
+        chunks = encoding.chunks
         if var is not None:
             if chunks is None:
                 # May emit warning for large shapes
                 chunks = var_metadata.shape
-            if chunks is not undefined:
-                var = var.chunk(chunks=chunks)
+            if not isinstance(chunks, Undefined):
+                new_vars[var_name] = var.chunk(chunks=chunks)
+            else:
+                new_vars[var_name] = var.copy(deep=False)
         else:
-            logger.warning(
-                f"Variable {var_name!r} not found in slice dataset; creating it."
-            )
-            if chunks is None or chunks is undefined:
+            missing_var_names.append(var_name)
+            if chunks is None or isinstance(chunks, Undefined):
                 # May emit warning for large shapes
                 chunks = var_metadata.shape
-            if encoding.get("_FillValue") is not None:
+            fill_value = encoding.fill_value
+            dtype = encoding.dtype
+            dtype = None if isinstance(dtype, Undefined) else np.dtype(dtype)
+            if fill_value is None or isinstance(fill_value, Undefined):
+                # Fill value is not defined, so we use the data type
+                # defined in the encoding, if any and fill memory with zeros.
+                memory_dtype = dtype if dtype is not None else np.dtype("float64")
+                memory_fill_value = 0
+            elif dtype is not None and dtype.kind == "f":
+                # Floating point data type, so we can keep it and
+                # use NaN where fill value will be stored.
+                memory_dtype = dtype
+                memory_fill_value = float("NaN")
+            elif (
+                dtype is not None
+                and dtype.kind in "iu"
+                and isinstance(encoding.scale_factor, Undefined)
+                and isinstance(encoding.add_offset, Undefined)
+            ):
+                # Unscaled integer data type, so we can keep it and
+                # fill memory with the fill value itself.
+                memory_dtype = dtype
+                memory_fill_value = fill_value
+            else:
                 # Since we have a defined fill value, the decoded in-memory
                 # variable uses NaN where fill value will be stored.
                 # This ia also what xarray does if decode_cf=True.
                 memory_dtype = np.dtype("float64")
                 memory_fill_value = float("NaN")
-            else:
-                # Fill value is not defined, so we use the data type
-                # defined in the encoding, if any and fill memory with zeros.
-                memory_dtype = encoding.get("dtype", np.dtype("float64"))
-                memory_fill_value = 0
-            var = xr.DataArray(
-                dask.array.full(
+            # Broadcasting a scalar yields chunks that are read-only views
+            # with zero strides, so no memory is allocated per chunk.
+            # Chunks that equal the fill value won't be written anyway,
+            # since we write with write_empty_chunks=False.
+            new_vars[var_name] = xr.DataArray(
+                dask.array.broadcast_to(
+                    np.array(memory_fill_value, dtype=memory_dtype),
                     var_metadata.shape,
-                    memory_fill_value,
                     chunks=chunks,
-                    dtype=np.dtype(memory_dtype),
                 ),
                 dims=var_metadata.dims,
             )
-        dataset[var_name] = var
+    if new_vars:
+        dataset.update(new_vars)
+    if missing_var_names:
+        logger.warning(
+            f"Variables not found in slice dataset, created them:"
+            f" {', '.join(map(repr, missing_var_names))}"
+        )
     return dataset